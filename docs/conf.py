@@ -4,8 +4,6 @@
 # list see the documentation:
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
 
-from importlib.metadata import version
-
 # -- Path setup --------------------------------------------------------------
 
 # If extensions (or modules to document with autodoc) are in another directory,
@@ -23,7 +21,12 @@ sys.path.insert(0, os.path.abspath('..'))
 project = 'Yaclog'
 copyright = '2021, Andrew Cassidy'
 author = 'Andrew Cassidy'
-release = version('yaclog')
+try:
+    # written by setuptools-scm at install time, avoids scanning site-packages for metadata
+    from yaclog._version import version as release
+except ImportError:
+    from importlib.metadata import version as _metadata_version
+    release = _metadata_version('yaclog')
 version = '.'.join(release.split('.')[:3])
 ref = version if len(release.split('.')) == 3 else 'main'
 
@@ -1,10 +1,15 @@
+import atexit
 import datetime
+import functools
 import os.path
+import shutil
+import tempfile
 import textwrap
 
-import yaclog.changelog
+import yaclog
+from yaclog.changelog import VersionEntry
 
-log_segments = [
+log_segments = (
     '# Changelog',
 
     'This changelog is for testing the parser, and has many things in it that might trip it up.',
@@ -41,41 +46,94 @@ log_segments = [
     '## Long Version Name',  # 15
 
     '[fullVersion]: http://endless.horse\n[id]: http://www.koalastothemax.com'
-]
+)
 
 log_text = '\n\n'.join(log_segments)
 
-log = yaclog.Changelog()
-log.preamble = '# Changelog\n\n' \
-               'This changelog is for testing the parser, and has many things in it that might trip it up.'
-log.links = {'id': 'http://www.koalastothemax.com'}
-log.versions = [yaclog.changelog.VersionEntry(), yaclog.changelog.VersionEntry(), yaclog.changelog.VersionEntry()]
 
-log.versions[0].name = '[Tests]'
-log.versions[0].sections = {
-    '': ['- bullet point with no section'],
-    'Bullet Points': [
-        '- bullet point dash',
-        '* bullet point star',
-        '+ bullet point plus\n  - sub point 1\n  - sub point 2\n  - sub point 3'],
-    'Blocks': [
-        '#### This is an H4',
-        '##### This is an H5',
-        '###### This is an H6',
+@functools.lru_cache(maxsize=None)
+def iso_date(date_string):
+    """Parse an ISO 8601 date, parsing each distinct date only once"""
+    return datetime.date.fromisoformat(date_string)
+
+
+@functools.lru_cache(maxsize=1)
+def reference_log():
+    """The changelog that `log_text` is expected to parse to. Built once and shared, so don't modify it!"""
+    log = yaclog.Changelog()
+    log.preamble = '# Changelog\n\n' \
+                   'This changelog is for testing the parser, and has many things in it that might trip it up.'
+    log.links = {'id': 'http://www.koalastothemax.com'}
+    log.versions = [
+        VersionEntry(name='[Tests]'),
+        VersionEntry(name='FullVersion', link='http://endless.horse', tags=('TAG1', 'TAG2'),
+                     date=iso_date('1969-07-20')),
+        VersionEntry(name='Long Version Name'),
+    ]
 
-        '- this is a bullet point\nit spans many lines',
+    log.versions[0].sections = {
+        '': ['- bullet point with no section'],
+        'Bullet Points': [
+            '- bullet point dash',
+            '* bullet point star',
+            '+ bullet point plus\n  - sub point 1\n  - sub point 2\n  - sub point 3'],
+        'Blocks': [
+            '#### This is an H4',
+            '##### This is an H5',
+            '###### This is an H6',
 
-        'This is\na paragraph\nit spans many lines',
+            '- this is a bullet point\nit spans many lines',
 
-        '```python\nthis is some example code\nit spans many lines\n```',
+            'This is\na paragraph\nit spans many lines',
 
-        '> this is a block quote\nit spans many lines',
-    ]
-}
+            '```python\nthis is some example code\nit spans many lines\n```',
+
+            '> this is a block quote\nit spans many lines',
+        ]
+    }
+
+    return log
+
+
+@functools.lru_cache(maxsize=1)
+def temp_dir():
+    """A temporary directory shared by the whole test session, removed on exit"""
+    td = tempfile.mkdtemp(prefix='yaclog-test-')
+    atexit.register(shutil.rmtree, td, ignore_errors=True)
+    return td
+
+
+@functools.lru_cache(maxsize=1)
+def parsed_log():
+    """
+    Write `log_text` to disk and parse it. Parsing is only done once, so don't modify the result!
+
+    :return: A tuple of (path, log)
+    """
+    path = os.path.join(temp_dir(), 'changelog.md')
+    with open(path, 'w') as fd:
+        fd.write(log_text)
+    return path, yaclog.read(path)
+
+
+@functools.lru_cache(maxsize=1)
+def git_template():
+    """
+    Create a git repository with an initial commit and a configured user. This is only done once,
+    so copy the result with :py:func:`shutil.copytree` instead of using it directly!
+
+    :return: The path to the repository
+    """
+    import git
+
+    path = os.path.join(temp_dir(), 'repo-template')
+    repo = git.Repo.init(path)
+    repo.index.commit('initial commit')
 
-log.versions[1].name = 'FullVersion'
-log.versions[1].link = 'http://endless.horse'
-log.versions[1].tags = ['TAG1', 'TAG2']
-log.versions[1].date = datetime.date.fromisoformat('1969-07-20')
+    with repo.config_writer() as cw:
+        cw.set_value('user', 'email', 'unit-tester@example.com')
+        cw.set_value('user', 'name', 'unit-tester')
+        cw.set_value('core', 'fsync', 'none')  # durability doesn't matter for a throwaway repo
 
-log.versions[2].name = 'Long Version Name'
+    repo.close()
+    return path
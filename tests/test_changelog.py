@@ -1,58 +1,94 @@
-import datetime
+import copy
 import os.path
-import tempfile
+import re
+import timeit
 import unittest
+from pathlib import Path
 
 import yaclog
-from tests.common import log, log_segments, log_text
+from tests.common import iso_date, log_segments, log_text, parsed_log, reference_log, temp_dir
 from yaclog.changelog import VersionEntry
 
+_segment_regex = re.compile(r'\n\n+')
+
 
 class TestParser(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        with tempfile.TemporaryDirectory() as td:
-            cls.path = os.path.join(td, 'changelog.md')
-            with open(cls.path, 'w') as fd:
-                fd.write(log_text)
-            cls.log = yaclog.read(cls.path)
+        cls.log = cls.load_log()
+        cls.expected = reference_log()
+        # the parser also finds the ref-style link for the FullVersion header
+        cls.expected_links = {**cls.expected.links, 'fullversion': 'http://endless.horse'}
+
+    @classmethod
+    def load_log(cls):
+        return yaclog.reads(log_text)
 
     def test_path(self):
         """Test the log's path"""
-        self.assertEqual(self.path, self.log.path)
+        self.assertIsNone(self.log.path)
 
     def test_preamble(self):
         """Test the preamble at the top of the file"""
-        self.assertEqual(log.preamble, self.log.preamble)
+        self.assertEqual(self.expected.preamble, self.log.preamble)
 
     def test_links(self):
         """Test the links at the end of the file"""
-        self.assertEqual({'fullversion': 'http://endless.horse', **log.links}, self.log.links)
+        self.assertEqual(self.expected_links, self.log.links)
 
     def test_versions(self):
         """Test the version headers"""
-        for i in range(len(self.log.versions)):
-            self.assertEqual(log.versions[i].name, self.log.versions[i].name)
-            self.assertEqual(log.versions[i].link, self.log.versions[i].link)
-            self.assertEqual(log.versions[i].date, self.log.versions[i].date)
-            self.assertEqual(log.versions[i].tags, self.log.versions[i].tags)
+        self.assertEqual(self.expected.versions, self.log.versions)
 
     def test_entries(self):
         """Test the change entries"""
-        self.assertEqual(log.versions[0].sections, self.log.versions[0].sections)
+        self.assertEqual([v.sections for v in self.expected.versions], [v.sections for v in self.log.versions])
+
+    def test_changelog(self):
+        """Test the entire changelog"""
+        expected = copy.copy(self.expected)
+        expected.links = self.expected_links
+        self.assertEqual(expected, self.log)
+
+
+class TestReader(TestParser):
+    """Runs the same checks as `TestParser` on a changelog read from disk"""
+
+    @classmethod
+    def load_log(cls):
+        cls.path, log = parsed_log()
+        return log
+
+    def test_path(self):
+        """Test the log's path"""
+        self.assertEqual(self.path, self.log.path)
+
+
+class TestMissingFile(unittest.TestCase):
+
+    def test_missing(self):
+        """Test that a changelog on a path that doesn't exist starts out empty"""
+        td = temp_dir()
+        Path(td, 'file.md').touch()
+        for path in [os.path.join(td, 'missing.md'), os.path.join(td, 'missing', 'CHANGELOG.md'),
+                     os.path.join(td, 'file.md', 'CHANGELOG.md')]:
+            with self.subTest(path=path):
+                log = yaclog.Changelog(path)
+                self.assertEqual(path, log.path)
+                self.assertEqual(yaclog.Changelog().preamble, log.preamble)
+                self.assertEqual([], log.versions)
+                self.assertEqual({}, log.links)
 
 
 class TestWriter(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        with tempfile.TemporaryDirectory() as td:
-            cls.path = os.path.join(td, 'changelog.md')
-            log.write(cls.path)
-            with open(cls.path) as fd:
-                cls.log_text = fd.read()
-                cls.log_segments = [line.lstrip('\n') for line in cls.log_text.split('\n\n') if line]
+        cls.path = os.path.join(temp_dir(), 'written.md')
+        reference_log().write(cls.path)
+        cls.log_text = Path(cls.path).read_text()
+        cls.log_segments = tuple(s for s in _segment_regex.split(cls.log_text) if s)
 
     def test_preamble(self):
         """Test the header information at the top of the file"""
@@ -80,86 +116,130 @@ class TestWriter(unittest.TestCase):
 
 
 class TestVersionEntry(unittest.TestCase):
-    def test_header_name(self):
-        """Test reading version names from headers"""
-        headers = {
-            'short': ('## Test', 'Test'),
-            'with dash': ('## Test - ', 'Test'),
-            'multi word': ('## Very long version name 1.0.0', 'Very long version name 1.0.0'),
-            'with brackets': ('## [Test]', '[Test]'),
-        }
-
-        for c, t in headers.items():
-            h = t[0]
+    # each case is (description, header, name, tags, date)
+    _HEADER_NAME_CASES = (
+        ('short', '## Test', 'Test', [], None),
+        ('with dash', '## Test - ', 'Test', [], None),
+        ('multi word', '## Very long version name 1.0.0', 'Very long version name 1.0.0', [], None),
+        ('with brackets', '## [Test]', '[Test]', [], None),
+    )
+
+    _HEADER_TAGS_CASES = (
+        ('no dash', '## Test [Foo] [Bar]', 'Test', ['FOO', 'BAR'], None),
+        ('with dash', '## Test - [Foo] [Bar]', 'Test', ['FOO', 'BAR'], None),
+        ('with brackets', '## [Test] [Foo] [Bar]', '[Test]', ['FOO', 'BAR'], None),
+        ('with brackets & dash', '## [Test] - [Foo] [Bar]', '[Test]', ['FOO', 'BAR'], None),
+        ('spaces in tags', '## Test [Foo Bar] [Baz]', 'Test', ['FOO BAR', 'BAZ'], None),
+        ('many tags', '## Test - 2021-04-19' + ' [Foo]' * 1000, 'Test', ['FOO'] * 1000, iso_date('2021-04-19')),
+    )
+
+    _HEADER_DATE_CASES = (
+        ('no dash', '## Test 1961-04-12', 'Test', [], iso_date('1961-04-12')),
+        ('with dash', '## Test 1969-07-20', 'Test', [], iso_date('1969-07-20')),
+        ('two dates', '## 1981-07-20 1988-11-15', '1981-07-20', [], iso_date('1988-11-15')),
+        ('single date', '## 2020-05-30', '2020-05-30', [], None),
+        ('with tags', '## 1.0.0 - 2021-04-19 [Foo] [Bar]', '1.0.0', ['FOO', 'BAR'], iso_date('2021-04-19')),
+    )
+
+    # headers that dont fit the schema, and should just be read as literals
+    _HEADER_NONCOMPLIANT_CASES = (
+        ('no space between tags', '## Test [Foo][Bar]', 'Test [Foo][Bar]', [], None),
+        ('text at end', '## Test [Foo] [Bar] Test', 'Test [Foo] [Bar] Test', [], None),
+        ('invalid date', '## Test - 9999-99-99', 'Test - 9999-99-99', [], None),
+    )
+
+    def check_headers(self, cases):
+        for c, h, name, tags, date in cases:
             with self.subTest(c, h=h):
                 version = VersionEntry.from_header(h)
-                self.assertEqual(version.name, t[1])
-                self.assertEqual(version.tags, [])
-                self.assertIsNone(version.date)
+                self.assertEqual(version.name, name)
+                self.assertEqual(version.tags, tags)
+                self.assertEqual(version.date, date)
                 self.assertIsNone(version.link)
                 self.assertIsNone(version.link_id)
 
+    def test_unhashable(self):
+        """Test that versions and changelogs, which are compared by value, can't be hashed"""
+        with self.assertRaises(TypeError):
+            hash(VersionEntry())
+        with self.assertRaises(TypeError):
+            hash(yaclog.Changelog())
+
+    def test_version_equality(self):
+        """Test that versions are compared by every field except line_no"""
+
+        def make_version():
+            version = VersionEntry(name='1.0.0', date=iso_date('2021-04-19'), tags=['PRERELEASE'],
+                                   link='https://example.com', link_id='1.0.0', line_no=5)
+            version.add_entry('- Foo', 'Added')
+            return version
+
+        self.assertEqual(make_version(), make_version())
+
+        other = make_version()
+        other.line_no = 10
+        self.assertEqual(make_version(), other, 'line_no should not affect equality')
+
+        for field, value in [('name', '1.0.1'), ('date', iso_date('2021-04-20')), ('tags', ['YANKED']),
+                             ('link', 'https://example.org'), ('link_id', 'v1'), ('sections', {'': []})]:
+            with self.subTest(field=field):
+                other = make_version()
+                setattr(other, field, value)
+                self.assertNotEqual(make_version(), other)
+
+        self.assertFalse(make_version() == '1.0.0')
+        self.assertNotEqual(make_version(), None)
+
+    def test_changelog_equality(self):
+        """Test that changelogs are compared by contents and not by path"""
+
+        def make_changelog(path=None):
+            changelog = yaclog.Changelog(path)
+            changelog.add_version(name='1.0.0').add_entry('- Foo', 'Added')
+            changelog.links['id'] = 'https://example.com'
+            return changelog
+
+        self.assertEqual(make_changelog(), make_changelog(os.path.join(temp_dir(), 'CHANGELOG.md')),
+                         'path should not affect equality')
+
+        for field, value in [('preamble', '# Other'), ('versions', []), ('links', {})]:
+            with self.subTest(field=field):
+                other = make_changelog()
+                setattr(other, field, value)
+                self.assertNotEqual(make_changelog(), other)
+
+        self.assertFalse(make_changelog() == make_changelog().versions)
+        self.assertNotEqual(make_changelog(), None)
+
+    def test_tags_uppercase(self):
+        """Test that tags passed to the constructor are stored in uppercase, like parsed tags"""
+        self.assertEqual(VersionEntry(tags=('Foo', 'bar baz')).tags, ['FOO', 'BAR BAZ'])
+
+    def test_header_name(self):
+        """Test reading version names from headers"""
+        self.check_headers(self._HEADER_NAME_CASES)
+
     def test_header_tags(self):
         """Test reading version tags from headers"""
-        headers = {
-            'no dash': ('## Test [Foo] [Bar]', 'Test', ['FOO', 'BAR']),
-            'with dash': ('## Test - [Foo] [Bar]', 'Test', ['FOO', 'BAR']),
-            'with brackets': ('## [Test] [Foo] [Bar]', '[Test]', ['FOO', 'BAR']),
-            'with brackets & dash': ('## [Test] - [Foo] [Bar]', '[Test]', ['FOO', 'BAR']),
-        }
-
-        for c, t in headers.items():
-            h = t[0]
-            with self.subTest(c, h=h):
-                version = VersionEntry.from_header(h)
-                self.assertEqual(version.name, t[1])
-                self.assertEqual(version.tags, t[2])
-                self.assertIsNone(version.date)
-                self.assertIsNone(version.link)
-                self.assertIsNone(version.link_id)
+        self.check_headers(self._HEADER_TAGS_CASES)
+
+    def test_header_tags_linear(self):
+        """Test that parsing time grows linearly with the number of tags"""
+
+        def parse_time(count):
+            header = '## Test' + ' [Foo]' * count
+            return min(timeit.repeat(lambda: VersionEntry.from_header(header), number=1, repeat=3))
+
+        # 8x the tags should take about 8x as long. A quadratic parser would take about 64x
+        self.assertLess(parse_time(40000), parse_time(5000) * 32)
 
     def test_header_date(self):
         """Test reading version dates from headers"""
-
-        headers = {
-            'no dash': ('## Test 1961-04-12', 'Test',
-                        datetime.date.fromisoformat('1961-04-12'), []),
-            'with dash': ('## Test 1969-07-20', 'Test',
-                          datetime.date.fromisoformat('1969-07-20'), []),
-            'two dates': ('## 1981-07-20 1988-11-15', '1981-07-20',
-                          datetime.date.fromisoformat('1988-11-15'), []),
-            'single date': ('## 2020-05-30', '2020-05-30', None, []),
-            'with tags': ('## 1.0.0 - 2021-04-19 [Foo] [Bar]', '1.0.0',
-                          datetime.date.fromisoformat('2021-04-19'), ['FOO', 'BAR']),
-        }
-
-        for c, t in headers.items():
-            h = t[0]
-            with self.subTest(c, h=h):
-                version = VersionEntry.from_header(h)
-                self.assertEqual(version.name, t[1])
-                self.assertEqual(version.date, t[2])
-                self.assertEqual(version.tags, t[3])
-                self.assertIsNone(version.link)
-                self.assertIsNone(version.link_id)
+        self.check_headers(self._HEADER_DATE_CASES)
 
     def test_header_noncompliant(self):
         """Test reading version that dont fit the schema, and should just be read as literals"""
-
-        headers = {
-            'no space between tags': 'Test [Foo][Bar]',
-            'text at end': 'Test [Foo] [Bar] Test',
-            'invalid date': 'Test - 9999-99-99',
-        }
-
-        for c, h in headers.items():
-            with self.subTest(c, h=h):
-                version = VersionEntry.from_header('## ' + h)
-                self.assertEqual(version.name, h)
-                self.assertEqual(version.tags, [])
-                self.assertIsNone(version.date)
-                self.assertIsNone(version.link)
-                self.assertIsNone(version.link_id)
+        self.check_headers(self._HEADER_NONCOMPLIANT_CASES)
 
 
 if __name__ == '__main__':
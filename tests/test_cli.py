@@ -1,322 +1,353 @@
+import copy
+import itertools
 import os.path
+import shutil
+import tempfile
 import unittest
 import traceback
 
-import git
+import click
 from click.testing import CliRunner
 
 import yaclog.changelog
-from yaclog.cli.__main__ import cli
+from yaclog.cli.__main__ import cli, add_entries, next_release, tag_version
+from tests.common import git_template
 
 
 def check_result(runner, result, success: bool = True):
-    runner.assertEqual((result.exit_code == 0), success,
-                       f'\noutput: {result.output}\ntraceback: ' + ''.join(
-                           traceback.format_exception(*result.exc_info)))
+    if (result.exit_code == 0) != success:
+        # only format the traceback when the check fails
+        runner.fail(f'\noutput: {result.output}\ntraceback: ' + ''.join(
+            traceback.format_exception(*result.exc_info)))
 
 
-class TestCreation(unittest.TestCase):
+class CliTestCase(unittest.TestCase):
+    """Base class for tests that share one temporary directory and initialized changelog per class"""
+
+    location = 'CHANGELOG.md'
+
+    @classmethod
+    def setUpClass(cls):
+        cls.runner = CliRunner()
+        cls.old_cwd = os.getcwd()
+        cls.directory = tempfile.mkdtemp(prefix='yaclog-cli-')
+        os.chdir(cls.directory)
+
+        cls.runner.invoke(cli, ['init'], catch_exceptions=False)  # create the changelog
+        cls.seed = os.path.join(cls.directory, cls.location + '.seed')
+        shutil.copyfile(cls.location, cls.seed)
+
+    @classmethod
+    def tearDownClass(cls):
+        os.chdir(cls.old_cwd)
+        shutil.rmtree(cls.directory)
+
+    def setUp(self):
+        # tests may change directory, so restore it along with a fresh changelog
+        os.chdir(self.directory)
+        shutil.copyfile(self.seed, self.location)
+
+
+class TestCreation(CliTestCase):
+    def setUp(self):
+        super().setUp()
+        os.remove(self.location)  # these tests create the changelog themselves
+
     def test_init(self):
         """Test creating and overwriting a changelog"""
-        runner = CliRunner()
-        location = 'CHANGELOG.md'
         err_str = 'THIS FILE WILL BE OVERWRITTEN'
 
-        with runner.isolated_filesystem():
-            result = runner.invoke(cli, ['init'])
-            check_result(self, result)
-            self.assertTrue(os.path.exists(os.path.abspath(location)), 'yaclog init did not create a file')
-            self.assertIn(location, result.output, "yaclog init did not echo the file's correct location")
+        result = self.runner.invoke(cli, ['init'])
+        check_result(self, result)
+        self.assertTrue(os.path.exists(os.path.abspath(self.location)), 'yaclog init did not create a file')
+        self.assertIn(self.location, result.output, "yaclog init did not echo the file's correct location")
 
-            with open(location, 'r') as fp:
-                self.assertEqual('# Changelog\n', fp.readline())
-                self.assertEqual('\n', fp.readline())
-                self.assertEqual('All notable changes to this project will be documented in this file',
-                                 fp.readline().rstrip())
+        with open(self.location, 'r') as fp:
+            self.assertEqual('# Changelog\n', fp.readline())
+            self.assertEqual('\n', fp.readline())
+            self.assertEqual('All notable changes to this project will be documented in this file',
+                             fp.readline().rstrip())
 
-            with open(location, 'w') as fp:
-                fp.write(err_str)
+        with open(self.location, 'w') as fp:
+            fp.write(err_str)
 
-            result = runner.invoke(cli, ['init'], input='y\n')
-            check_result(self, result)
-            self.assertTrue(os.path.exists(os.path.abspath(location)), 'file no longer exists after overwrite')
-            self.assertIn(location, result.output, "yaclog init did not echo the file's correct location")
+        result = self.runner.invoke(cli, ['init'], input='y\n')
+        check_result(self, result)
+        self.assertTrue(os.path.exists(os.path.abspath(self.location)), 'file no longer exists after overwrite')
+        self.assertIn(self.location, result.output, "yaclog init did not echo the file's correct location")
 
-            with open(location, 'r') as fp:
-                self.assertNotEqual(fp.read(), err_str, 'file was not overwritten')
+        with open(self.location, 'r') as fp:
+            self.assertNotEqual(fp.read(), err_str, 'file was not overwritten')
 
     def test_init_path(self):
         """Test creating a changelog with a non-default filename"""
-        runner = CliRunner()
         location = 'A different file.md'
+        self.addCleanup(os.remove, os.path.join(self.directory, location))
 
-        with runner.isolated_filesystem():
-            result = runner.invoke(cli, ['--path', location, 'init'])
-            check_result(self, result)
-            self.assertTrue(os.path.exists(os.path.abspath(location)), 'yaclog init did not create a file')
-            self.assertIn(location, result.output, "yaclog init did not echo the file's correct location")
+        result = self.runner.invoke(cli, ['--path', location, 'init'])
+        check_result(self, result)
+        self.assertTrue(os.path.exists(os.path.abspath(location)), 'yaclog init did not create a file')
+        self.assertIn(location, result.output, "yaclog init did not echo the file's correct location")
 
     def test_does_not_exist(self):
         """Test if an error is thrown when the file does not exist"""
-        runner = CliRunner()
+        result = self.runner.invoke(cli, ['show'])
+        check_result(self, result, False)
+        self.assertIn('does not exist', result.output)
 
-        with runner.isolated_filesystem():
-            result = runner.invoke(cli, ['show'])
-            check_result(self, result, False)
-            self.assertIn('does not exist', result.output)
 
+class TestTagging(CliTestCase):
+    def setUp(self):
+        super().setUp()
+        self.log = yaclog.Changelog()
+        self.log.add_version(name='0.9.0')
+        self.log.add_version(name='1.0.0')
 
-class TestTagging(unittest.TestCase):
     def test_tag_addition(self):
         """Test adding tags to versions"""
-        runner = CliRunner()
-        location = 'CHANGELOG.md'
-
-        with runner.isolated_filesystem():
-            in_log = yaclog.Changelog(location)
-            in_log.versions = [yaclog.changelog.VersionEntry(), yaclog.changelog.VersionEntry()]
+        tag_version(self.log, 'tag1')
+        tag_version(self.log, 'tag2', '0.9.0')
+        self.assertEqual(self.log.versions[0].tags, ['TAG1'])
+        self.assertEqual(self.log.versions[1].tags, ['TAG2'])
 
-            in_log.versions[0].name = '1.0.0'
-            in_log.versions[1].name = '0.9.0'
-            in_log.write()
-
-            result = runner.invoke(cli, ['tag', 'tag1'])
-            check_result(self, result)
-
-            result = runner.invoke(cli, ['tag', 'tag2', '0.9.0'])
-            check_result(self, result)
-
-            out_log = yaclog.read(location)
-            self.assertEqual(out_log.versions[0].tags, ['TAG1'])
-            self.assertEqual(out_log.versions[1].tags, ['TAG2'])
-
-            result = runner.invoke(cli, ['tag', 'tag3', '0.8.0'])
-            check_result(self, result, False)
+        with self.assertRaises(click.BadArgumentUsage):
+            tag_version(self.log, 'tag3', '0.8.0')
 
     def test_tag_deletion(self):
         """Test deleting tags from versions"""
-        runner = CliRunner()
-        location = 'CHANGELOG.md'
-
-        with runner.isolated_filesystem():
-            in_log = yaclog.Changelog(location)
-            in_log.versions = [None, None]
-            in_log.versions = [yaclog.changelog.VersionEntry(), yaclog.changelog.VersionEntry()]
-
-            in_log.versions[0].name = '1.0.0'
-            in_log.versions[0].tags = ['TAG1']
-
-            in_log.versions[1].name = '0.9.0'
-            in_log.versions[1].tags = ['TAG2']
-            in_log.write()
-
-            result = runner.invoke(cli, ['tag', '-d', 'tag2', '0.8.0'])
-            check_result(self, result, False)
-
-            result = runner.invoke(cli, ['tag', '-d', 'tag3', '0.9.0'])
-            check_result(self, result, False)
-
-            result = runner.invoke(cli, ['tag', '-d', 'tag1'])
-            check_result(self, result)
-
-            out_log = yaclog.read(location)
-            self.assertEqual(out_log.versions[0].tags, [])
-            self.assertEqual(out_log.versions[1].tags, ['TAG2'])
-
-            result = runner.invoke(cli, ['tag', '-d', 'tag2', '0.9.0'])
-            check_result(self, result)
-
-            out_log = yaclog.read(location)
-            self.assertEqual(out_log.versions[0].tags, [])
-            self.assertEqual(out_log.versions[1].tags, [])
+        self.log.versions[0].tags = ['TAG1']
+        self.log.versions[1].tags = ['TAG2']
 
+        with self.assertRaises(click.BadArgumentUsage):
+            tag_version(self.log, 'tag2', '0.8.0', add=False)
 
-class TestRelease(unittest.TestCase):
-    def test_increment(self):
-        """Test version incrementing on release"""
-        runner = CliRunner()
-        location = 'CHANGELOG.md'
-
-        with runner.isolated_filesystem():
-            runner.invoke(cli, ['init'])  # create the changelog
-            runner.invoke(cli, ['entry', '-b', 'entry number 1'])
-
-            result = runner.invoke(cli, ['release', '1.0.0'])
-            check_result(self, result)
-            self.assertEqual(yaclog.read(location).versions[0].name, '1.0.0')
-            self.assertIn('1.0.0', result.output)
+        with self.assertRaises(click.BadArgumentUsage):
+            tag_version(self.log, 'tag3', '0.9.0', add=False)
 
-            runner.invoke(cli, ['entry', '-b', 'entry number 2'])
+        tag_version(self.log, 'tag1', add=False)
+        self.assertEqual(self.log.versions[0].tags, [])
+        self.assertEqual(self.log.versions[1].tags, ['TAG2'])
 
-            result = runner.invoke(cli, ['release', '-p'])
-            check_result(self, result)
-            self.assertEqual(yaclog.read(location).versions[0].name, '1.0.1')
-            self.assertIn('1.0.1', result.output)
+        tag_version(self.log, 'tag2', '0.9.0', add=False)
+        self.assertEqual(self.log.versions[0].tags, [])
+        self.assertEqual(self.log.versions[1].tags, [])
 
-            result = runner.invoke(cli, ['release', '-y', '-s', 2])
-            check_result(self, result)
-            self.assertEqual(yaclog.read(location).versions[0].name, '1.0.2')
-            self.assertIn('1.0.2', result.output)
+    def test_tag_command(self):
+        """Test modifying tags from the command line"""
+        self.log.write(self.location)
 
-            runner.invoke(cli, ['entry', '-b', 'entry number 3'])
+        result = self.runner.invoke(cli, ['tag', 'tag1', '0.9.0'])
+        check_result(self, result)
+        self.assertEqual(yaclog.read(self.location).versions[1].tags, ['TAG1'])
 
-            result = runner.invoke(cli, ['release', '-m'])
-            check_result(self, result)
-            self.assertEqual(yaclog.read(location).versions[0].name, '1.1.0')
-            self.assertIn('1.1.0', result.output)
+        result = self.runner.invoke(cli, ['tag', '-d', 'tag1'])
+        check_result(self, result, False)
 
-            runner.invoke(cli, ['entry', '-b', 'entry number 4'])
 
-            result = runner.invoke(cli, ['release', '-M'])
-            check_result(self, result)
-            self.assertEqual(yaclog.read(location).versions[0].name, '2.0.0')
-            self.assertIn('2.0.0', result.output)
+class TestEntry(CliTestCase):
+    def test_add_entries(self):
+        """Test adding entries to versions"""
+        log = yaclog.Changelog()
+        log.add_version(name='1.0.0')
 
-            runner.invoke(cli, ['entry', '-b', 'entry number 5'])
+        version = add_entries(log, bullets=['entry number 1'])
+        self.assertIs(version, log.versions[0])
+        self.assertEqual(version.name, 'Unreleased')
+        self.assertEqual(version.sections[''], ['- entry number 1'])
 
-            result = runner.invoke(cli, ['release', '-Ma'])
-            check_result(self, result)
-            self.assertEqual(yaclog.read(location).versions[0].name, '3.0.0a1')
-            self.assertIn('3.0.0a1', result.output)
+        add_entries(log, paragraphs=['entry number 2'], section_name='fixed', version_name='1.0.0')
+        self.assertEqual(log.versions[1].sections['Fixed'], ['entry number 2'])
 
-            result = runner.invoke(cli, ['release', '-b'])
-            check_result(self, result)
-            self.assertEqual(yaclog.read(location).versions[0].name, '3.0.0b1')
-            self.assertIn('3.0.0b1', result.output)
+        with self.assertRaises(click.BadArgumentUsage):
+            add_entries(log, bullets=['entry number 3'], version_name='0.8.0')
 
-            result = runner.invoke(cli, ['release', '-r'])
-            check_result(self, result)
-            self.assertEqual(yaclog.read(location).versions[0].name, '3.0.0rc1')
-            self.assertIn('3.0.0rc1', result.output)
+    def test_entry_command(self):
+        """Test adding entries from the command line"""
+        result = self.runner.invoke(cli, ['entry', '-b', 'entry number 1', '-p', 'entry number 2', 'added'])
+        check_result(self, result)
+        self.assertIn('Created 2 entries in section Added', result.output)
 
-            result = runner.invoke(cli, ['release', '-r'])
-            check_result(self, result)
-            self.assertEqual(yaclog.read(location).versions[0].name, '3.0.0rc2')
-            self.assertIn('3.0.0rc1', result.output)
+        version = yaclog.read(self.location).versions[0]
+        self.assertEqual(version.name, 'Unreleased')
+        self.assertEqual(version.sections['Added'], ['entry number 2', '- entry number 1'])
 
-            result = runner.invoke(cli, ['release', '-f'])
-            check_result(self, result)
-            self.assertEqual(yaclog.read(location).versions[0].name, '3.0.0')
-            self.assertIn('3.0.0', result.output)
 
-            result = runner.invoke(cli, ['release', '-p', '-n'])
-            check_result(self, result)
-            self.assertEqual(yaclog.read(location).versions[0].name, '3.0.1')
-            self.assertEqual(yaclog.read(location).versions[1].name, '3.0.0')
-            self.assertIn('3.0.1', result.output)
-
-    def test_commit(self):
-        """Test committing and tagging releases"""
-        runner = CliRunner()
-
-        with runner.isolated_filesystem():
-            repo = git.Repo.init(os.path.join(os.curdir, 'testing'))
-            os.chdir('testing')
-            repo.index.commit('initial commit')
-
-            with repo.config_writer() as cw:
-                cw.set_value('user', 'email', 'unit-tester@example.com')
-                cw.set_value('user', 'name', 'unit-tester')
-
-            runner.invoke(cli, ['init'])  # create the changelog
-            runner.invoke(cli, ['entry', '-b', 'entry number 1'])
+class TestRelease(CliTestCase):
+    def test_increment(self):
+        """Test version incrementing on release"""
 
-            result = runner.invoke(cli, ['release', 'Version 1.0.0', '-c'], input='y\n')
-            check_result(self, result)
-            self.assertIn('Created commit', result.output)
-            self.assertIn('Created tag', result.output)
-            self.assertIn(repo.head.commit.hexsha[0:7], result.output)
-            self.assertEqual(repo.tags[0].name, '1.0.0')
+        # each case is (prior version names, whether to add an entry first, release arguments, expected name)
+        cases = (
+            ((), True, {'version_name': '1.0.0'}, '1.0.0'),
+            (('1.0.0',), True, {'rel_seg': 2}, '1.0.1'),
+            (('1.0.1', '1.0.0'), False, {'rel_seg': 2}, '1.0.2'),
+            (('1.0.2',), True, {'rel_seg': 1}, '1.1.0'),
+            (('1.1.0',), True, {'rel_seg': 0}, '2.0.0'),
+            (('2.0.0',), True, {'rel_seg': 0, 'pre_seg': 'a'}, '3.0.0a1'),
+            (('3.0.0a1', '2.0.0'), False, {'pre_seg': 'b'}, '3.0.0b1'),
+            (('3.0.0b1',), False, {'pre_seg': 'rc'}, '3.0.0rc1'),
+            (('3.0.0rc1',), False, {'pre_seg': 'rc'}, '3.0.0rc2'),
+            (('3.0.0rc2',), False, {'pre_seg': ''}, '3.0.0'),
+            (('3.0.0',), False, {'rel_seg': 2, 'new': True}, '3.0.1'),
+        )
+
+        for prior, entry, kwargs, expected in cases:
+            with self.subTest(expected, **kwargs):
+                log = yaclog.Changelog()
+                log.versions = [yaclog.changelog.VersionEntry(name=name) for name in prior]
+                if entry:
+                    add_entries(log, bullets=['entry number 1'])
+
+                version, name = next_release(log, **kwargs)
+                version.name = name
+
+                # releasing an existing version renames it, anything else releases a new version on top
+                older = prior if entry or kwargs.get('new') else prior[1:]
+                self.assertEqual([v.name for v in log.versions], [expected, *older])
+
+    def test_release_command(self):
+        """Test releasing versions from the command line"""
+        self.runner.invoke(cli, ['entry', '-b', 'entry number 1'], catch_exceptions=False)
+
+        result = self.runner.invoke(cli, ['release', '1.0.0'])
+        check_result(self, result)
+        self.assertIn('1.0.0', result.output)
+
+        result = self.runner.invoke(cli, ['release', '-y', '-p'])
+        check_result(self, result)
+        self.assertIn('1.0.1', result.output)
+        self.assertEqual(yaclog.read(self.location).versions[0].name, '1.0.1')
+
+        result = self.runner.invoke(cli, ['release'])
+        check_result(self, result, False)
+        self.assertIn('Nothing to release!', result.output)
+
+        # check that each increment option reaches next_release with the right value
+        log = yaclog.Changelog()
+        log.add_version(name='1.2.3rc1')
+        log.add_version().add_entry('- entry number 1')
+        flag_seed = os.path.join(self.directory, 'flags.md.seed')
+        log.write(flag_seed)
+        self.addCleanup(os.remove, flag_seed)
+
+        # each case is (release flags, expected version names afterwards)
+        cases = (
+            (['-p'], ['1.2.4', '1.2.3rc1']),
+            (['-s', '2'], ['1.2.4', '1.2.3rc1']),
+            (['-m'], ['1.3.0', '1.2.3rc1']),
+            (['-M'], ['2.0.0', '1.2.3rc1']),
+            (['-Ma'], ['2.0.0a1', '1.2.3rc1']),
+            (['-a'], ['1.2.3a1', '1.2.3rc1']),
+            (['-b'], ['1.2.3b1', '1.2.3rc1']),
+            (['-r'], ['1.2.3rc2', '1.2.3rc1']),
+            (['-f'], ['1.2.3', '1.2.3rc1']),
+            (['-p', '-n'], ['1.2.4', 'Unreleased', '1.2.3rc1']),
+        )
+
+        for flags, expected in cases:
+            with self.subTest(flags=flags):
+                shutil.copyfile(flag_seed, self.location)
+                result = self.runner.invoke(cli, ['release', '-y'] + flags)
+                check_result(self, result)
+                self.assertIn(expected[0], result.output)
+                self.assertEqual([v.name for v in yaclog.read(self.location).versions], expected)
 
     def test_cargo(self):
         """Test updating cargo.toml files"""
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            with open("Cargo.toml", "w") as fp:
-                fp.write((
-                    '[package]\n'
-                    'name = "dummy"\n'
-                    'version = "0.3.4"\n'
-                    'authors = ["Andrew Cassidy <drewcassidy@me.com>"]\n'
-                    'description = "A dummy crate used for testing yaclog"\n'
-                    'keywords = ["does", "not", "exist"]\n'
-                    'edition = "2018"\n'
-                ))
-
-            runner.invoke(cli, ['init'])  # create the changelog
-            runner.invoke(cli, ['entry', '-b', 'entry number 1'])
+        with open("Cargo.toml", "w") as fp:
+            fp.write((
+                '[package]\n'
+                'name = "dummy"\n'
+                'version = "0.3.4"\n'
+                'authors = ["Andrew Cassidy <drewcassidy@me.com>"]\n'
+                'description = "A dummy crate used for testing yaclog"\n'
+                'keywords = ["does", "not", "exist"]\n'
+                'edition = "2018"\n'
+            ))
+        self.addCleanup(os.remove, os.path.join(self.directory, 'Cargo.toml'))
 
-            result = runner.invoke(cli, ['release', 'Version 1.0.0', '-C'])
-            check_result(self, result)
+        self.runner.invoke(cli, ['entry', '-b', 'entry number 1'], catch_exceptions=False)
 
-            with open("Cargo.toml", "r") as fp:
-                self.assertIn('version = "1.0.0"', fp.read())
-                # we're just going to trust tomlkit not to mangle everything else
+        result = self.runner.invoke(cli, ['release', 'Version 1.0.0', '-C'])
+        check_result(self, result)
 
+        with open("Cargo.toml", "r") as fp:
+            self.assertIn('version = "1.0.0"', fp.read())
+            # we're just going to trust tomlkit not to mangle everything else
 
-class TestShow(unittest.TestCase):
 
-    # noinspection PyShadowingNames
-    def setUp(self):
-        self.runner = CliRunner()
-        self.location = 'CHANGELOG.md'
-
-        self.log = yaclog.Changelog()
+@unittest.skipUnless(shutil.which('git'), 'git is not installed')
+class TestCommit(CliTestCase):
+    """Tests that run real git commands, kept in their own class so they can be selected or skipped together"""
 
-        self.log.add_version(name='1.0.0').add_entry('- entry number 1')
-        self.log.add_version(name='Version 2.0.0').add_entry('- entry number 2', 'Added')
-        self.log.add_version(name='Three Point Oh').add_entry('entry number 3')
-        v = self.log.add_version(name='4.0.0 "Euclid"')
+    def test_commit(self):
+        """Test committing and tagging releases"""
+        import git
+
+        shutil.copytree(git_template(), 'testing')
+        self.addCleanup(shutil.rmtree, os.path.join(self.directory, 'testing'))
+        repo = git.Repo('testing')
+        self.addCleanup(repo.close)
+        os.chdir('testing')
+
+        shutil.copyfile(self.seed, self.location)  # the repo gets its own copy of the changelog
+        self.runner.invoke(cli, ['entry', '-b', 'entry number 1'], catch_exceptions=False)
+
+        result = self.runner.invoke(cli, ['release', 'Version 1.0.0', '-c'], input='y\n')
+        check_result(self, result)
+        self.assertIn('Created commit', result.output)
+        self.assertIn('Created tag', result.output)
+        self.assertIn(repo.head.commit.hexsha[0:7], result.output)
+        self.assertEqual(repo.tags[0].name, '1.0.0')
+
+
+class TestShow(CliTestCase):
+    modes = {
+        'full': ([], lambda v, k: v.text(**k), '\n\n'),
+        'name': (['-n'], lambda v, k: v.name, '\n'),
+        'body': (['-b'], lambda v, k: v.body(**k), '\n\n'),
+        'header': (['-h'], lambda v, k: v.header(**k), '\n'),
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.template = yaclog.Changelog()
+
+        cls.template.add_version(name='1.0.0').add_entry('- entry number 1')
+        cls.template.add_version(name='Version 2.0.0').add_entry('- entry number 2', 'Added')
+        cls.template.add_version(name='Three Point Oh').add_entry('entry number 3')
+        v = cls.template.add_version(name='4.0.0 "Euclid"')
         v.add_entry('- entry number 4')
         v.add_entry('- entry number 5')
         v.tags.append('TAGGED')
+        cls.template.write(cls.seed)  # setUp copies this into place for every test
 
-        self.modes = {
-            'full': ([], lambda v, k: v.text(**k), '\n\n'),
-            'name': (['-n'], lambda v, k: v.name, '\n'),
-            'body': (['-b'], lambda v, k: v.body(**k), '\n\n'),
-            'header': (['-h'], lambda v, k: v.header(**k), '\n'),
-        }
+    def setUp(self):
+        super().setUp()
+        self.log = copy.deepcopy(self.template)
 
     def test_show_all(self):
         """Test showing all version information"""
+        for mode, t in self.modes.items():
+            with self.subTest(mode, flags=t[0]):
+                check_result(self, result := self.runner.invoke(cli, ['show', '-a'] + t[0]))
+                self.assertEqual(t[2].join([t[1](v, {'md': False}) for v in self.log.versions]),
+                                 result.output.strip(), 'incorrect plaintext output')
 
-        with self.runner.isolated_filesystem():
-            self.log.write(self.location)
-
-            for mode, t in self.modes.items():
-                with self.subTest(mode, flags=t[0]):
-                    check_result(self, result := self.runner.invoke(cli, ['show', '-a'] + t[0]))
-                    self.assertEqual(t[2].join([t[1](v, {'md': False}) for v in self.log.versions]),
-                                     result.output.strip(), 'incorrect plaintext output')
-
-                    check_result(self, result := self.runner.invoke(cli, ['show', '-am'] + t[0]))
-                    self.assertEqual(t[2].join([t[1](v, {'md': True}) for v in self.log.versions]),
-                                     result.output.strip(), 'incorrect markdown output')
+                check_result(self, result := self.runner.invoke(cli, ['show', '-am'] + t[0]))
+                self.assertEqual(t[2].join([t[1](v, {'md': True}) for v in self.log.versions]),
+                                 result.output.strip(), 'incorrect markdown output')
 
     def test_show_version(self):
-        with self.runner.isolated_filesystem():
-            self.log.write(self.location)
-
-            for mode, t in self.modes.items():
-                with self.subTest(mode, flags=t[0]):
-
-                    for version in self.log.versions:
-                        check_result(self, result := self.runner.invoke(cli, ['show', version.name] + t[0]))
-                        self.assertEqual(t[1](version, {'md': False}),
-                                         result.output.strip(), 'incorrect plaintext output')
-
-                        check_result(self, result := self.runner.invoke(cli, ['show', version.name[-5:]] + t[0]))
-                        self.assertEqual(t[1](version, {'md': False}),
-                                         result.output.strip(), 'incorrect plaintext output')
-
-                        check_result(self, result := self.runner.invoke(cli, ['show', version.name, '-m'] + t[0]))
-                        self.assertEqual(t[1](version, {'md': True}),
-                                         result.output.strip(), 'incorrect markdown output')
-
-                        check_result(self, result := self.runner.invoke(cli, ['show', version.name[-5:], '-m'] + t[0]))
-                        self.assertEqual(t[1](version, {'md': True}),
-                                         result.output.strip(), 'incorrect markdown output')
+        """Test showing individual versions by full and partial name"""
+        cases = itertools.product(self.modes.items(), self.log.versions, (False, True))
+        for (mode, t), version, md in cases:
+            for name in (version.name, version.name[-5:]):
+                with self.subTest(mode, version=name, md=md):
+                    check_result(self, result := self.runner.invoke(cli, ['show', name] + (['-m'] if md else []) + t[0]))
+                    self.assertEqual(t[1](version, {'md': md}), result.output.strip(),
+                                     'incorrect markdown output' if md else 'incorrect plaintext output')
 
 
 if __name__ == '__main__':
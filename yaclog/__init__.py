@@ -9,3 +9,14 @@ def read(path):
     :return: a parsed Changelog object
     """
     return Changelog(path)
+
+
+def reads(text):
+    """
+    Create a new Changelog object from a markdown string
+    :param text: the contents of a markdown changelog file
+    :return: a parsed Changelog object
+    """
+    log = Changelog()
+    log.parse(text)
+    return log
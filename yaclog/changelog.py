@@ -23,8 +23,8 @@ from __future__ import annotations
 
 import datetime
 import os
-import re
-from typing import List, Optional, Dict
+import sys
+from typing import List, Optional, Dict, Iterable
 
 import click  # only for styling
 
@@ -38,18 +38,15 @@ class VersionEntry:
     containing the changes made since the previous version
     """
 
-    _header_regex = re.compile(  # THE LANGUAGE OF THE GODS
-        r"##\s+(?P<name>.*?)(?:\s+-)?(?:\s+(?P<date>\d{4}-\d{2}-\d{2}))?(?P<tags>(?:\s+\[[^]]*?])*)\s*$")
-
-    _tag_regex = re.compile(r'\[(?P<tag>[^]]*?)]')
+    __slots__ = ('name', 'date', 'tags', 'link', 'link_id', 'line_no', 'sections')
 
     def __init__(self, name: str = 'Unreleased',
-                 date: Optional[datetime.date] = None, tags: Optional[List[str]] = None,
+                 date: Optional[datetime.date] = None, tags: Optional[Iterable[str]] = None,
                  link: Optional[str] = None, link_id: Optional[str] = None, line_no: Optional[int] = None):
         """
         :param str name: The version's name
         :param Optional[datetime.date] date: When the version was released
-        :param tags: The version's tags
+        :param tags: The version's tags, which are stored in uppercase
         :param link: The version's URL
         :param link_id: The version's link ID
         :param line_no: What line in the original file the version starts on
@@ -61,7 +58,7 @@ class VersionEntry:
         self.date: Optional[datetime.date] = date
         """When the version was released"""
 
-        self.tags: List[str] = tags if tags else []
+        self.tags: List[str] = [tag.upper() for tag in tags] if tags is not None else []
         """The version's tags"""
 
         self.link: Optional[str] = link
@@ -90,19 +87,46 @@ class VersionEntry:
         """
         version = cls(line_no=line_no)
 
-        match = cls._header_regex.match(header)
-        assert match, f'failed to parse version header: "{header}"'
-
-        version.name, version.link, version.link_id = markdown.strip_link(match['name'])
-
-        if match['date']:
-            try:
-                version.date = datetime.date.fromisoformat(match['date'])
-            except ValueError:
-                return cls(name=header.lstrip('#').strip(), line_no=line_no)
-
-        if match['tags']:
-            version.tags = [m['tag'].upper() for m in cls._tag_regex.finditer(match['tags'])]
+        assert header.startswith('##') and header[2:3].isspace(), f'failed to parse version header: "{header}"'
+
+        # The header is parsed right-to-left in a single linear scan with no backtracking:
+        # "## name [- ][date ][TAG1] [TAG2]..."
+        # Everything before `end` is still unparsed, and the name is only sliced out once at the end
+        name = header[2:].strip()
+        end = len(name)
+        tags = []
+
+        def skip_space(index):
+            # move an end index left past any whitespace
+            while index > 0 and name[index - 1].isspace():
+                index -= 1
+            return index
+
+        # tags are bracketed and separated from everything before them by whitespace
+        while end > 0 and name[end - 1] == ']':
+            start = name.find('[', name.rfind(']', 0, end - 1) + 1, end - 1)
+            while start >= 0 and not name[start - 1:start].isspace():
+                start = name.find('[', start + 1, end - 1)
+            if start < 0:
+                break
+            tags.append(name[start + 1:end - 1].upper())
+            end = skip_space(start)
+
+        if end > 10 and name[end - 11].isspace():
+            date = name[end - 10:end]
+            if date[4] == date[7] == '-' and date[0:4].isdecimal() and date[5:7].isdecimal() and date[8:10].isdecimal():
+                try:
+                    version.date = datetime.date.fromisoformat(date)
+                except ValueError:
+                    return cls(name=header.lstrip('#').strip(), line_no=line_no)
+                end = skip_space(end - 10)
+
+        if end > 1 and name[end - 1] == '-' and name[end - 2].isspace():
+            end = skip_space(end - 1)
+
+        name = name[:end]
+        version.name, version.link, version.link_id = markdown.strip_link(name)
+        version.tags = tags[::-1]
 
         return version
 
@@ -114,11 +138,7 @@ class VersionEntry:
         :param section: Which section to add to.
         """
 
-        section = section.title()
-        if section not in self.sections.keys():
-            self.sections[section] = []
-
-        self.sections[section].append(contents)
+        self.sections.setdefault(sys.intern(section.title()) if section else '', []).append(contents)
 
     def body(self, md: bool = True, color: bool = False) -> str:
         """
@@ -216,6 +236,20 @@ class VersionEntry:
     def __str__(self) -> str:
         return self.header(False)
 
+    def __repr__(self) -> str:
+        return (f'{type(self).__name__}(name={self.name!r}, date={self.date!r}, tags={self.tags!r}, '
+                f'link={self.link!r}, link_id={self.link_id!r}, sections={self.sections!r})')
+
+    def __eq__(self, other) -> bool:
+        # line_no is only a hint about where the version was read from, so it isn't compared
+        if not isinstance(other, VersionEntry):
+            return NotImplemented
+        return (self.name, self.date, self.tags, self.link, self.link_id, self.sections) == \
+            (other.name, other.date, other.tags, other.link, other.link_id, other.sections)
+
+    # versions are mutable and compared by value, so they can't be hashed
+    __hash__ = None
+
 
 class Changelog:
     """
@@ -244,8 +278,11 @@ class Changelog:
         self.links: Dict[str, str] = {}
         """Link definitions at the end of the changelog, as a dictionary of ``{id: url}``"""
 
-        if path and os.path.exists(path):
-            self.read()
+        if path:
+            try:
+                self.read()
+            except (FileNotFoundError, NotADirectoryError):
+                pass  # the file will be created when the changelog is written
 
     def read(self, path=None) -> None:
         """
@@ -261,44 +298,52 @@ class Changelog:
 
         # Read file
         with open(path, 'r') as fp:
-            tokens, links = markdown.tokenize(fp.read())
+            self.parse(fp.read())
+
+    def parse(self, text: str) -> None:
+        """
+        Parse a markdown changelog from a string. The object's contents will be overwritten by the parsed contents.
+
+        :param text: The markdown text to parse
+        """
+
+        tokens, links = markdown.tokenize(text)
 
-        section = ''
+        entries = None  # the entry list of the current version section
         versions = []
         preamble_segments = []
 
         for token in tokens:
-            text = '\n'.join(token.lines)
+            token_text = '\n'.join(token.lines)
 
             if token.kind == 'h2':
                 # start of a version
-                versions.append(VersionEntry.from_header(text, line_no=token.line_no))
-                section = ''
+                versions.append(version := VersionEntry.from_header(token_text, line_no=token.line_no))
+                entries = version.sections['']
 
             elif len(versions) == 0:
                 # we haven't encountered any version headers yet,
                 # so its best to just add this line to the preamble
-                preamble_segments.append(text)
+                preamble_segments.append(token_text)
 
             elif token.kind == 'h3':
                 # start of a version section
-                section = text.strip('#').strip()
-                if section not in versions[-1].sections.keys():
-                    versions[-1].sections[section] = []
+                # section names repeat across versions, so intern them to share one key object per name
+                entries = versions[-1].sections.setdefault(sys.intern(token_text.strip('#').strip()), [])
 
             else:
                 # change log entry
-                versions[-1].sections[section].append(text)
+                entries.append(token_text)
 
         # handle links
         for version in versions:
-            if match := re.fullmatch(r'\[(.*)]', version.name):
-                # ref-matched link
-                link_id = match[1].lower()
+            if len(version.name) >= 2 and version.name[0] == '[' and version.name[-1] == ']':
+                # ref-matched link in the form [name]
+                link_id = version.name[1:-1].lower()
                 if link_id in links:
                     version.link = links[link_id]
                     version.link_id = None
-                    version.name = match[1]
+                    version.name = version.name[1:-1]
 
             elif version.link_id in links:
                 # id-matched link
@@ -398,3 +443,12 @@ class Changelog:
 
     def __len__(self) -> int:
         return len(self.versions)
+
+    def __eq__(self, other) -> bool:
+        # two changelogs with the same contents are equal regardless of where they are stored
+        if not isinstance(other, Changelog):
+            return NotImplemented
+        return (self.preamble, self.versions, self.links) == (other.preamble, other.versions, other.links)
+
+    # changelogs are mutable and compared by value, so they can't be hashed
+    __hash__ = None
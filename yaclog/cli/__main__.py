@@ -17,11 +17,12 @@
 import datetime
 import os.path
 from sys import stdout
+from typing import Iterable, Optional, Tuple
 
 import click
 
 import yaclog.version
-from yaclog.changelog import Changelog
+from yaclog.changelog import Changelog, VersionEntry
 
 
 @click.group()
@@ -130,16 +131,15 @@ def show(obj: Changelog, all_versions, markdown, mode, version_names, gh_actions
     click.echo(sep.join([str_func(v, kwargs) for v in versions]))
 
 
-@cli.command(short_help='Modify version tags')
-@click.option('--add/--delete', '-a/-d', default=True, is_flag=True, help='Add or delete tags')
-@click.argument('tag_name', metavar='TAG', type=str)
-@click.argument('version_name', metavar='VERSION', type=str, required=False)
-@click.pass_obj
-def tag(obj: Changelog, add, tag_name: str, version_name: str):
+def tag_version(obj: Changelog, tag_name: str, version_name: Optional[str] = None, add: bool = True) -> VersionEntry:
     """
-    Modify TAG on VERSION.
+    Add or delete a tag on a version in the changelog, without writing it to disk
 
-    VERSION is the name of a version to add tags to. If not given, the most recent version is used.
+    :param obj: The changelog to modify
+    :param tag_name: The tag to add or delete
+    :param version_name: The name of the version to modify. If not given, the most recent version is used.
+    :param add: Add the tag if true, delete it otherwise
+    :return: The modified version
     """
     tag_name = tag_name.upper()
     try:
@@ -160,26 +160,37 @@ def tag(obj: Changelog, add, tag_name: str, version_name: str):
         except ValueError:
             raise click.BadArgumentUsage(f"Tag {tag_name} not found in version {version.name}.")
 
-    obj.write()
+    return version
 
 
-@cli.command(short_help='Add entries to the changelog.')
-@click.option('--bullet', '-b', 'bullets', metavar='TEXT', multiple=True, type=str, help='Add a bullet point.')
-@click.option('--paragraph', '-p', 'paragraphs', metavar='TEXT', multiple=True, type=str, help='Add a paragraph')
-@click.argument('section_name', metavar='SECTION', type=str, default='', required=False)
-@click.argument('version_name', metavar='VERSION', type=str, default=None, required=False)
+@cli.command(short_help='Modify version tags')
+@click.option('--add/--delete', '-a/-d', default=True, is_flag=True, help='Add or delete tags')
+@click.argument('tag_name', metavar='TAG', type=str)
+@click.argument('version_name', metavar='VERSION', type=str, required=False)
 @click.pass_obj
-def entry(obj: Changelog, bullets, paragraphs, section_name, version_name):
+def tag(obj: Changelog, add, tag_name: str, version_name: str):
     """
-    Add entries to SECTION in VERSION
-
-    SECTION is the name of the section to append to. If not given, entries will be uncategorized.
+    Modify TAG on VERSION.
 
-    VERSION is the name of the version to append to. If not given, the most recent version will be used,
-    or a new 'Unreleased' version will be added if the most recent version has been released.
+    VERSION is the name of a version to add tags to. If not given, the most recent version is used.
     """
+    tag_version(obj, tag_name, version_name, add)
+    obj.write()
 
-    section_name = section_name.title()
+
+def add_entries(obj: Changelog, bullets: Iterable[str] = (), paragraphs: Iterable[str] = (),
+                section_name: str = '', version_name: Optional[str] = None) -> VersionEntry:
+    """
+    Add entries to a version in the changelog, without writing it to disk
+
+    :param obj: The changelog to modify
+    :param bullets: Bullet points to add
+    :param paragraphs: Paragraphs to add
+    :param section_name: The name of the section to append to. If not given, entries will be uncategorized.
+    :param version_name: The name of the version to append to. If not given, the most recent version will be used,
+        or a new 'Unreleased' version will be added if the most recent version has been released.
+    :return: The modified version
+    """
     try:
         if version_name:
             version = obj.get_version(version_name)
@@ -194,6 +205,27 @@ def entry(obj: Changelog, bullets, paragraphs, section_name, version_name):
     for b in bullets:
         version.add_entry('- ' + b, section_name)
 
+    return version
+
+
+@cli.command(short_help='Add entries to the changelog.')
+@click.option('--bullet', '-b', 'bullets', metavar='TEXT', multiple=True, type=str, help='Add a bullet point.')
+@click.option('--paragraph', '-p', 'paragraphs', metavar='TEXT', multiple=True, type=str, help='Add a paragraph')
+@click.argument('section_name', metavar='SECTION', type=str, default='', required=False)
+@click.argument('version_name', metavar='VERSION', type=str, default=None, required=False)
+@click.pass_obj
+def entry(obj: Changelog, bullets, paragraphs, section_name, version_name):
+    """
+    Add entries to SECTION in VERSION
+
+    SECTION is the name of the section to append to. If not given, entries will be uncategorized.
+
+    VERSION is the name of the version to append to. If not given, the most recent version will be used,
+    or a new 'Unreleased' version will be added if the most recent version has been released.
+    """
+
+    section_name = section_name.title()
+    version = add_entries(obj, bullets, paragraphs, section_name, version_name)
     obj.write()
     count = len(paragraphs) + len(bullets)
     message = f"Created {count} {['entry', 'entries'][min(count - 1, 1)]}"
@@ -204,6 +236,40 @@ def entry(obj: Changelog, bullets, paragraphs, section_name, version_name):
     click.echo(message)
 
 
+def next_release(obj: Changelog, version_name: Optional[str] = None, rel_seg: Optional[int] = None,
+                 pre_seg: Optional[str] = None, new: bool = False) -> Tuple[VersionEntry, str]:
+    """
+    Pick the version to release and work out its new name, without renaming it
+
+    :param obj: The changelog to release from
+    :param version_name: The name to release the version as. If not given, the most recent
+        valid PEP440 version number in the changelog is used instead.
+    :param rel_seg: Which segment of the release number to increment, if any
+    :param pre_seg: Which kind of prerelease to increment, if any. An empty string clears the prerelease.
+    :param new: Add a new version to release instead of using the most recent one
+    :return: A tuple of (version, new name)
+    """
+    if new:
+        cur_version = obj.add_version()
+    else:
+        cur_version = obj.current_version()
+
+    if version_name:
+        new_name = version_name
+    else:
+        for v in obj.versions:
+            if v.version is not None:
+                new_name = v.name
+                break
+        else:
+            new_name = '0.0.0'
+
+    if rel_seg is not None or pre_seg is not None:
+        new_name = yaclog.version.increment_version(new_name, rel_seg, pre_seg)
+
+    return cur_version, new_name
+
+
 @cli.command(short_help='Release versions.')
 @click.option('-M', '--major', 'rel_seg', flag_value=0, type=int, default=None,
               help='Increment major version number.')
@@ -248,25 +314,9 @@ def release(obj: Changelog, version_name, rel_seg, pre_seg, commit, cargo, yes,
         click.echo('Nothing to release!')
         raise click.Abort
 
-    if new:
-        cur_version = obj.add_version()
-    else:
-        cur_version = obj.current_version()
+    cur_version, new_name = next_release(obj, version_name, rel_seg, pre_seg, new)
     old_name = cur_version.name
 
-    if version_name:
-        new_name = version_name
-    else:
-        for v in obj.versions:
-            if v.version is not None:
-                new_name = v.name
-                break
-        else:
-            new_name = '0.0.0'
-
-    if rel_seg is not None or pre_seg is not None:
-        new_name = yaclog.version.increment_version(new_name, rel_seg, pre_seg)
-
     if new_name != old_name:
         if yaclog.version.is_release(old_name) and not yes:
             click.confirm(
@@ -22,6 +22,7 @@ import re
 from typing import List
 
 bullets = '+-*'
+bullet_prefixes = tuple(f'{b} ' for b in bullets)  # list item markers, for use with str.startswith
 brackets = '[]'
 code_regex = re.compile(r'^```')
 header_regex = re.compile(r'^(?P<hashes>#+)\s+(?P<contents>[^#]+)(?:\s+#+)?$')
@@ -31,6 +32,8 @@ bullet_regex = re.compile(r'^[-+*] ')
 link_id_regex = re.compile(r'^\[(?P<link_id>\S*)]:\s*(?P<link>.*)')
 link_def_regex = re.compile(r'\[(?P<text>.*?)]\[(?P<link_id>.*?)]')  # deferred link in the form [name][id]
 link_lit_regex = re.compile(r'\[(?P<text>.*?)]\((?P<link>.*?)\)')  # literal link in the form [name](url)
+# either of the above. Literal links end with ')' and deferred links with ']', so a full match can only be one of them
+link_regex = re.compile(r'\[(?P<text>.*?)](?:\((?P<link>.*?)\)|\[(?P<link_id>.*?)])')
 
 setext_h1_replace_regex = re.compile(r'(?<=\n)(?P<header>[^\n]+?)\n=+[ \t]*(?=\n)')
 setext_h2_replace_regex = re.compile(r'(?<=\n)(?P<header>[^\n]+?)\n-+[ \t]*(?=\n)')
@@ -44,15 +47,19 @@ def strip_link(text):
     :return: A tuple of (name, url, id). If the input is not a link, it is returned verbatim as the name.
     """
 
-    if link_lit := link_lit_regex.fullmatch(text):
-        # in the form [name](link)
-        return link_lit['text'], link_lit['link'], None
+    if not text.startswith('['):
+        # both link forms start with a bracket, so plain names can skip the regex
+        return text, None, None
+
+    if not (match := link_regex.fullmatch(text)):
+        return text, None, None
 
-    if link_def := link_def_regex.fullmatch(text):
-        # in the form [name][id] where id is hopefully linked somewhere else in the document
-        return link_def['text'], None, link_def['link_id'].lower()
+    if match['link'] is not None:
+        # in the form [name](link)
+        return match['text'], match['link'], None
 
-    return text, None, None
+    # in the form [name][id] where id is hopefully linked somewhere else in the document
+    return match['text'], None, match['link_id'].lower()
 
 
 def join(segments: List[str]) -> str:
@@ -64,18 +71,22 @@ def join(segments: List[str]) -> str:
     """
 
     text: List[str] = []
-    last_segment = ''
+    last_kind = None
     for segment in segments:
-        if bullet_regex.match(segment) and bullet_regex.match(last_segment):
-            pass
-        elif numbered_regex.match(segment) and numbered_regex.match(last_segment):
-            pass
+        # classify each segment once, consecutive list items of the same kind aren't separated by a blank line
+        if segment.startswith(bullet_prefixes):
+            kind = 'bullet'
+        elif segment[:1].isdecimal() and numbered_regex.match(segment):
+            kind = 'numbered'
         else:
+            kind = None
+
+        if kind is None or kind != last_kind:
             text.append('')
 
         text.append(segment)
 
-        last_segment = segment
+        last_kind = kind
 
     return '\n'.join(text).strip()
 
@@ -121,29 +132,33 @@ def tokenize(text: str):
     block = None
 
     for line_no, line in enumerate(lines):
+        # fixed prefixes are checked with str.startswith, and the remaining regexes are each
+        # anchored to a distinct first character, which is checked before trying them
+        first = line[:1]
+
         if block == 'code':
             # this is the contents of a code block
             assert block == tokens[-1].kind, 'block state variable in invalid state!'
             tokens[-1].lines.append(line)
-            if code_regex.match(line):
+            if line.startswith('```'):
                 block = None
 
-        elif code_regex.match(line):
+        elif line.startswith('```'):
             # this is the start of a code block
             tokens.append(Token(line_no, [line], 'code'))
             block = 'code'
 
-        elif li_regex.match(line):
+        elif line.startswith(bullet_prefixes) or (first.isdecimal() and numbered_regex.match(line)):
             # this is a list item
             tokens.append(Token(line_no, [line], 'li'))
             block = 'li'
 
-        elif match := header_regex.match(line):
+        elif first == '#' and (match := header_regex.match(line)):
             # this is a header
             kind = f'h{len(match["hashes"])}'
             tokens.append(Token(line_no, [line], kind))
 
-        elif match := link_id_regex.match(line):
+        elif first == '[' and (match := link_id_regex.match(line)):
             # this is a link definition in the form '[id]: link'
             links[match['link_id'].lower()] = match['link']
             block = None
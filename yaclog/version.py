@@ -19,6 +19,7 @@ meant to augment the `packaging.version` module.
 #  You should have received a copy of the GNU Affero General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import functools
 import re
 from typing import Optional, Tuple
 
@@ -27,9 +28,11 @@ from packaging.version import Version, VERSION_PATTERN
 version_regex = re.compile(VERSION_PATTERN, re.VERBOSE | re.IGNORECASE)
 
 
+@functools.lru_cache(maxsize=1024)
 def extract_version(version_str: str) -> Tuple[Optional[Version], int, int]:
     """
-    Extracts a :pep:`440` version object from a string which may have other text
+    Extracts a :pep:`440` version object from a string which may have other text.
+    Results are cached, since the same version names are checked repeatedly when searching a changelog
 
     :param version_str: The input string to extract from
     :return: A tuple of (version, start, end), where start and end are the span of the version in the original string